@@ -1,36 +1,154 @@
 """This module defines the AllCyclesData class, which is used to store and manipulate 24-hour weather data.
 """
 from metar.Metar import Metar, QUANTITY_ATTRS
-from metar.Units import ureg
-from metar.Datatypes import metar_types
-from metar.Station import stations
-from shapely.geometry import Point
+from metar.Datatypes import pressure
+from metar.Units import UREG_UNITS, ureg
+from metar._units_fast import apply_conversion
+from metar.Station import get_stations
 from numpy import nan
+import numpy as np
 import geopandas as gpd
-import aiohttp
+import httpx
+import gzip
+import os
+import re
 import asyncio
 import pandas as pd
 import pint_pandas
 import pickle
 import time
-from multiprocessing import Pool, cpu_count
-from functools import partial
-
-
-# Helper function to split a list of strings into sublists, using empty strings as delimiters
-def _split_list_on_empty_string(lst):
-    result = []
-    current_sublist = []
-    for item in lst:
-        if item == "":
-            if current_sublist:  # Avoid adding empty sub-lists
-                result.append(current_sublist)
-                current_sublist = []
-        else:
-            current_sublist.append(item)
-    if current_sublist:  # Add the last sublist if it's not empty
-        result.append(current_sublist)
-    return result
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
+from functools import lru_cache, partial
+from itertools import chain
+from datetime import timezone
+
+
+# Shared HTTP client, created lazily so that all cycle fetches reuse the same
+# connections to the NOAA server (multiplexed over HTTP/2 when available).
+_CLIENT = None
+_CLIENT_LOOP = None
+# Async generator that closes the client when its event loop shuts down
+_CLIENT_CLOSER = None
+
+
+# Metar attributes that are copied into the decoded dataframe. Only the
+# quantity and direction attributes hold Datatypes objects.
+_DIRECTION_ATTRS = (
+    "wind_dir",
+    "wind_dir_from",
+    "wind_dir_to",
+    "vis_dir",
+    "max_vis_dir",
+    "wind_dir_peak",
+)
+_EXTRA_SCALAR_ATTRS = _DIRECTION_ATTRS + (
+    "code",
+    "type",
+    "correction",
+    "mod",
+    "station_id",
+    "time",
+    "cycle",
+    "runway",
+    "weather",
+    "recent",
+    "sky",
+    "windshear",
+    "peak_wind_time",
+    "wind_shift_time",
+)
+_KNOWN_ATTRS = tuple(QUANTITY_ATTRS) + _EXTRA_SCALAR_ATTRS
+# Quantity attributes are exported as the Datatypes objects themselves, and
+# converted in bulk by CycleData._convert_units
+_VALUE_ATTRS = frozenset(_DIRECTION_ATTRS)
+# quantity columns are converted to the units of their first value, except these
+_COLUMN_UNITS = {pressure: "MB"}
+
+_UTC = timezone.utc
+
+# Completed cycle files are cached here, see CycleData._fetch_cycle_data
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "python-metar")
+# Names of the cached cycle files, as made by CycleData._cycle_cache_path
+_CYCLE_CACHE_RE = re.compile(r"^\d{8}_\d\dZ\.txt\.gz$")
+
+# Matches the leading groups of a report, up to the observation time
+_METAR_TIME_RE = re.compile(
+    r"""^(?:(?:METAR|SPECI)\s+)?(?:COR\s+)?[A-Z][A-Z0-9]{3}\s+
+        (?P<day>\d\d)(?P<hour>\d\d)(?P<min>\d\d)Z?(?:\s+|$)""",
+    re.VERBOSE,
+)
+
+# Worker pool used to decode large batches of reports, created on first use
+_EXECUTOR = None
+# Below this many reports, decoding in-process beats feeding the worker pool
+_PARALLEL_THRESHOLD = 2000
+_MIN_CHUNK_SIZE = 500
+
+
+def _get_executor():
+    """Return the shared process pool, creating it on first use."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=cpu_count())
+    return _EXECUTOR
+
+
+@lru_cache(maxsize=None)
+def _get_station_coordinates():
+    """Return the longitudes and latitudes of the known stations, keyed by id."""
+    stations = get_stations()
+    lons = {station_id: station.longitude for station_id, station in stations.items()}
+    lats = {station_id: station.latitude for station_id, station in stations.items()}
+    return lons, lats
+
+
+async def _close_client_at_shutdown(client):
+    """Wait until the event loop shuts down its async generators (as
+    asyncio.run does on exit), then close the client."""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+async def _close_client():
+    """Close the shared httpx client, if there is one."""
+    global _CLIENT, _CLIENT_LOOP, _CLIENT_CLOSER
+    closer = _CLIENT_CLOSER
+    _CLIENT = _CLIENT_LOOP = _CLIENT_CLOSER = None
+    if closer is not None:
+        try:
+            await closer.aclose()
+        except RuntimeError:
+            # the connections belong to an event loop that is already closed
+            pass
+
+
+async def _get_client():
+    """Return the shared httpx client, creating it on first use.
+
+    The client is bound to the running event loop. It is closed by an async
+    generator parked on that loop, which only runs when the loop's
+    shutdown_asyncgens() is called, as asyncio.run does on exit. On a loop
+    that is never shut down, the client stays open until CycleData.aclose()
+    is awaited or the client is replaced for another loop."""
+    global _CLIENT, _CLIENT_LOOP, _CLIENT_CLOSER
+    loop = asyncio.get_running_loop()
+    # a client's connections are bound to the event loop it was created in
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop:
+        # normally the old client was closed when its loop shut down
+        await _close_client()
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+        _CLIENT = httpx.AsyncClient(http2=True, limits=limits, timeout=60.0)
+        _CLIENT_LOOP = loop
+        _CLIENT_CLOSER = _close_client_at_shutdown(_CLIENT)
+        await _CLIENT_CLOSER.__anext__()
+    return _CLIENT
+
+
+# A report in a cycle file: a timestamp header line, then the report itself
+_REPORT_RE = re.compile(r"^(?P<hdr>\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2})[ \t\r]*\n(?P<body>[^\n]+)", re.MULTILINE)
 
 class CycleData(object):
     """An object representing a 24-hour period of weather data."""
@@ -53,10 +171,28 @@ class CycleData(object):
                      f'Columns: {list(self.dataframe.columns)}'
         return (f'Weather Data from {self.start_time} to {self.end_time} in {self.tz} timezone.\n'
                 f'{df_summary}')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    @classmethod
+    async def aclose(cls):
+        """Close the shared HTTP client used to fetch cycle data.
+
+        The client is closed automatically when asyncio.run returns. Callers
+        on a long-lived event loop (e.g. a server or a notebook) should
+        await CycleData.aclose() when done, or use a CycleData instance in an
+        "async with" block, which closes the client on exit."""
+        await _close_client()
         
     def save_instance(self, filename):
+        # protocol 5 (PEP 574) pickles the numpy buffers behind the dataframe
+        # without copying them through intermediate bytes objects
         with open(filename, "wb") as file:
-            pickle.dump(self, file)
+            pickle.dump(self, file, protocol=5)
             
         
     @classmethod
@@ -66,109 +202,211 @@ class CycleData(object):
         return instance
         
     @classmethod
-    async def create_instance(cls, start_time = pd.Timestamp.now(tz = "UTC") - pd.Timedelta(days=1),
-                 end_time = pd.Timestamp.now(tz = "UTC"), tz = "UTC"):
+    async def create_instance(cls, start_time = None, end_time = None, tz = "UTC"):
+        """Fetch and decode the METAR reports between start_time and end_time.
+
+        The reports are fetched with a shared HTTP client that stays open
+        between calls. It is closed when asyncio.run shuts its event loop
+        down. On a long-lived loop, await CycleData.aclose() when done."""
+        # use a single "now" for all of the time checks in this call
+        now = pd.Timestamp.now(tz = _UTC)
+        if start_time is None:
+            start_time = now - pd.Timedelta(days=1)
+        if end_time is None:
+            end_time = now
         
-        start_time, end_time = cls._handle_time_input(start_time, end_time)
-        start_cycle, end_cycle = cls._get_cycle_range(start_time, end_time)
+        start_time, end_time = cls._handle_time_input(start_time, end_time, now)
+        start_cycle, end_cycle = cls._get_cycle_range(start_time, end_time, now)
         
         
         print(f"Fetching cycles {start_cycle.hour} to {end_cycle.hour}...")
-        cycles_txt_list = await cls._fetch_cycle_txt_list(start_cycle, end_cycle)
+        cycles_txt_list = await cls._fetch_cycle_txt_list(start_cycle, end_cycle, now)
         print("Cycle data has been fetched!")
         
-        cycles_txt_series = cls._process_cycles_txt_list_to_series(cycles_txt_list)
-        print(f"Processing {len(cycles_txt_series)} METAR reports...")
+        metar_series = cls._extract_metar_reports(cycles_txt_list)
+        print(f"Processing {len(metar_series)} METAR reports...")
         
-        metar_series = cls._extract_metar_reports(cycles_txt_series)
+        metar_series = cls._drop_reports_outside_range(metar_series, start_time, end_time, now)
         decoded_metar_df = cls._decode_metar_series(metar_series)
+        # drop rows before converting units, which is the most expensive step
+        decoded_metar_df = cls._filter_by_time(decoded_metar_df, start_time, end_time)
         decoded_metar_df = cls._convert_units(decoded_metar_df)
-        decoded_metar_df = cls._set_timezone_and_sort_dataframe(decoded_metar_df, start_time, end_time, tz)
+        decoded_metar_df = cls._sort_and_reindex(decoded_metar_df, tz)
         decoded_metar_df = cls._add_position_column(decoded_metar_df)
         print("Data has been processed!")
         
         return cls(decoded_metar_df, start_time, end_time, tz)
     
     @staticmethod
-    def _handle_time_input(start_time, end_time):
+    def _handle_time_input(start_time, end_time, now):
         # ensure that start_time and end_time are in the same timezone, and that end_time is after start_time
-        start_time = start_time.tz_convert(tz = "UTC")
-        end_time = end_time.tz_convert(tz = "UTC")
+        start_time = start_time.tz_convert(tz = _UTC)
+        end_time = end_time.tz_convert(tz = _UTC)
         if start_time > end_time:
             raise ValueError("start_time must be before end_time")
         # ensure that start_time and end_time are not in the future
-        if start_time > pd.Timestamp.now(tz = "UTC"):
+        if start_time > now:
             raise ValueError("start_time must not be in the future")
-        if end_time > pd.Timestamp.now(tz = "UTC"):
+        if end_time > now:
             raise ValueError("end_time must not be in the future")
         # ensure that start_time and end_time are not more than 24 hours apart. Add a second since end_time is calculated after start_time
         if end_time - start_time > pd.Timedelta(days=1, seconds=1):
             raise ValueError("start_time and end_time must not be more than 24 hours apart")
         # ensure that start_time is not more than 24 hours before now
-        if pd.Timestamp.now(tz = "UTC") - start_time > pd.Timedelta(days=1, seconds=1):
+        if now - start_time > pd.Timedelta(days=1, seconds=1):
             raise ValueError("start_time must not be more than 24 hours before now")
         return start_time, end_time
 
     @staticmethod
-    def _get_cycle_range(start_time, end_time):
+    def _get_cycle_range(start_time, end_time, now):
         """Get the range of cycles that contain the given time range."""
-        start_cycle = start_time.replace(minute=0, second=0, microsecond=0)
-        end_cycle = end_time.replace(minute=0, second=0, microsecond=0)
+        start_cycle = start_time.floor("h")
+        end_cycle = end_time.floor("h")
         if start_time.minute >= 45:
             start_cycle += pd.Timedelta(hours=1)
         if end_time.minute >= 45:
             end_cycle += pd.Timedelta(hours=1)
         # handle the case where the start and end times are in the same hour (when 24 hrs), or when the start_time cycle == current cycle
-        if start_cycle.hour == end_cycle.hour or start_cycle.hour == CycleData._get_current_cycle().hour:
+        if start_cycle.hour == end_cycle.hour or start_cycle.hour == CycleData._get_current_cycle(now).hour:
             end_cycle += pd.Timedelta(hours=1)
         return start_cycle, end_cycle
     
     @staticmethod
-    def _get_current_cycle():
+    def _get_current_cycle(now):
         """Get the current cycle."""
-        cycle = pd.Timestamp.now(tz = "UTC").replace(minute=0, second=0, microsecond=0)
-        if cycle.minute >= 45:
+        cycle = now.floor("h")
+        if now.minute >= 45:
             cycle += pd.Timedelta(hours=1)
         return cycle
         
     @staticmethod
-    async def _fetch_cycle_data(session, cycle):
-        """Asynchronously fetch a cycle of METAR data."""
-        url = f"https://tgftp.nws.noaa.gov/data/observations/metar/cycles/{cycle:02}Z.TXT"
-        async with session.get(url) as response:
-            return await response.text(errors="ignore")
+    def _cycle_cache_path(cycle):
+        """Get the path of the on-disk cache file for the given cycle."""
+        return os.path.join(_CACHE_DIR, f"{cycle:%Y%m%d_%H}Z.txt.gz")
+
+    @staticmethod
+    def _write_cycle_cache(cache_path, cycle_txt, current_cycle):
+        """Save a cycle of METAR data to the on-disk cache, if possible, and
+        remove the cached cycles that are too old to be read again."""
+        # write to a temporary file first so that readers never see a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with gzip.open(tmp_path, "wt") as file:
+                file.write(cycle_txt)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        CycleData._prune_cycle_cache(current_cycle)
+
+    @staticmethod
+    def _prune_cycle_cache(current_cycle):
+        """Delete the cached cycles older than the oldest one that is still read."""
+        oldest = f"{current_cycle - pd.Timedelta(hours=23):%Y%m%d_%H}Z.txt.gz"
+        try:
+            file_names = os.listdir(_CACHE_DIR)
+        except OSError:
+            return
+        for file_name in file_names:
+            # the file names sort in time order
+            if _CYCLE_CACHE_RE.match(file_name) and file_name < oldest:
+                try:
+                    os.remove(os.path.join(_CACHE_DIR, file_name))
+                except OSError:
+                    pass
+
+    @staticmethod
+    async def _fetch_cycle_data(client, cycle, current_cycle):
+        """Asynchronously fetch a cycle of METAR data.
+
+        Cycles that are complete won't change anymore, so they are read from
+        (and saved to) an on-disk cache. The server only keeps the last 24 cycles
+        in files named by hour, so the file for the current cycle's hour one
+        day ago has already been overwritten and is never cached."""
+        cacheable = current_cycle - pd.Timedelta(hours=23) <= cycle < current_cycle
+        cache_path = CycleData._cycle_cache_path(cycle)
+        if cacheable and os.path.exists(cache_path):
+            try:
+                with gzip.open(cache_path, "rt") as file:
+                    return file.read()
+            except (OSError, EOFError):
+                pass
+        url = f"https://tgftp.nws.noaa.gov/data/observations/metar/cycles/{cycle.hour:02}Z.TXT"
+        response = await client.get(url)
+        cycle_txt = response.content.decode(response.encoding, errors="ignore")
+        if cacheable and response.status_code == 200:
+            CycleData._write_cycle_cache(cache_path, cycle_txt, current_cycle)
+        return cycle_txt
 
     @staticmethod
-    async def _fetch_cycle_txt_list(start_cycle, end_cycle):
-        """Fetch METAR cycles data asynchronously."""
-        async with aiohttp.ClientSession() as session:
-            tasks = [CycleData._fetch_cycle_data(session, cycle.hour) for cycle in pd.date_range(start_cycle, end_cycle, freq="h")]
-            cycles_txt_list = await asyncio.gather(*tasks)
+    async def _fetch_cycle_txt_list(start_cycle, end_cycle, now):
+        """Fetch METAR cycles data asynchronously, using the shared client."""
+        client = await _get_client()
+        current_cycle = CycleData._get_current_cycle(now)
+        tasks = [CycleData._fetch_cycle_data(client, cycle, current_cycle) for cycle in pd.date_range(start_cycle, end_cycle, freq="h")]
+        cycles_txt_list = await asyncio.gather(*tasks)
         return cycles_txt_list
     
     @staticmethod
     def _metar_to_value_dict(metar_encoded_str):
         """Convert a Metar object to a dictionary of values."""
         metar = Metar(metar_encoded_str, strict=False)
-        dict = metar.__dict__.copy()
-        for key, value in dict.items():
-            if type(value) in metar_types:
-                dict[key] = value.value()
-        return dict
+        # missing values are left as nan, which is a float
+        return {
+            attr: (value.value() if attr in _VALUE_ATTRS and not isinstance(value, float) else value)
+            for attr in _KNOWN_ATTRS
+            for value in (getattr(metar, attr, nan),)
+        }
     
     @staticmethod
-    def _process_cycles_txt_list_to_series(cycles_txt_list):
-        cycles_txt_series = pd.Series(cycles_txt_list).str.split("\n")
-        cycles_txt_series = cycles_txt_series.apply(_split_list_on_empty_string).explode().reset_index(drop=True)
-        return cycles_txt_series
+    def _extract_metar_reports(cycles_txt_list):
+        """Return the unique METAR reports in the cycle files, in the order they
+        first appear."""
+        # each report is a timestamp header line followed by the report itself,
+        # so one regex scan over all of the text finds every report
+        buf = "\n\n".join(cycles_txt_list)
+        # consecutive cycle files overlap, so a report can appear more than once
+        seen = set()
+        reports = [
+            report
+            for report in (match.group("body").strip() for match in _REPORT_RE.finditer(buf))
+            if not (report in seen or seen.add(report))
+        ]
+        return pd.Series(reports, dtype=object)
     
     @staticmethod
-    def _extract_metar_reports(cycles_txt_series):
-        return cycles_txt_series.str[1].str.strip().drop_duplicates().reset_index(drop=True)
+    def _drop_reports_outside_range(metar_series, start_time, end_time, now):
+        """Drop the reports that are known to fall outside the time range before
+        running the full parser on them.
+
+        The observation time is extracted from all reports at once with a
+        single regex. Reports whose time can't be read this way are kept, and
+        are left for the full parser to handle."""
+        groups = metar_series.str.extract(_METAR_TIME_RE).astype(float)
+        # to_datetime would roll e.g. minute 99 over into the next hour
+        valid = (groups["hour"] < 24) & (groups["min"] < 60)
+        groups = groups.where(valid)
+        # same month/year guess as Metar._handleTime: days after today are from last month
+        last_month = groups["day"] > now.day
+        month = np.where(last_month, (now.month - 2) % 12 + 1, now.month)
+        year = np.where(last_month & (now.month == 1), now.year - 1, now.year)
+        times = pd.to_datetime(
+            pd.DataFrame({"year": year, "month": month, "day": groups["day"],
+                          "hour": groups["hour"], "minute": groups["min"]}),
+            errors="coerce",
+            utc=True,
+        )
+        # invalid times are NaT, and are kept as well
+        outside_mask = times.notna() & ~((times >= start_time) & (times <= end_time))
+        return metar_series[~outside_mask].reset_index(drop=True)
     
     @staticmethod
     def _split_series(series, n_chunks):
-        """Split a Pandas Series into smaller Series chunks, handling uneven lengths."""
+        """Split a Pandas Series into smaller list chunks, handling uneven lengths."""
         total_len = len(series)
         # Ensure we do not exceed the number of chunks than the series length
         n_chunks = min(n_chunks, total_len)
@@ -182,73 +420,97 @@ class CycleData(object):
             # Determine the size of this chunk
             chunk_size = base_chunk_size + (1 if i < larger_chunks_count else 0)
             end_idx = start_idx + chunk_size
-            # Create the chunk and add it to the list
-            chunks.append(series.iloc[start_idx:end_idx])
+            # Create the chunk and add it to the list. Plain lists are much
+            # cheaper to pickle to the worker processes than Series.
+            chunks.append(series.iloc[start_idx:end_idx].tolist())
             # Update the start index for the next chunk
             start_idx = end_idx
 
         return chunks
+
     @staticmethod
     def _apply_function_to_chunk(chunk, f):
-        """Apply a function to each element in a chunk of a Pandas Series."""
-        # Use Series.apply to apply `func` to the chunk
-        return chunk.apply(f)
+        """Apply a function to each element in a chunk."""
+        return [f(item) for item in chunk]
 
     @staticmethod
-    def _parallel_process_series(series, f, n_chunks=cpu_count()):
-        """Process a Pandas Series in parallel by splitting it into chunks.
-        Hopefully this will be faster than .apply() for large Series."""
+    def _parallel_process_series(series, f, n_chunks=None):
+        """Process a Pandas Series in parallel by splitting it into chunks, and
+        return the list of results in order.
+        Small Series are processed in this process, since starting and feeding
+        the workers would cost more than the work itself."""
+        if len(series) < _PARALLEL_THRESHOLD:
+            return [f(item) for item in series]
+        if n_chunks is None:
+            # keep chunks large, but have a few per worker to avoid stragglers
+            n_chunks = max(1, min(len(series) // _MIN_CHUNK_SIZE, cpu_count() * 4))
         series_chunks = CycleData._split_series(series, n_chunks)
         worker_with_func = partial(CycleData._apply_function_to_chunk, f=f)
         
-        with Pool() as pool:
-            processed_chunks = pool.map(worker_with_func, series_chunks)
+        processed_chunks = _get_executor().map(worker_with_func, series_chunks)
         
-        # Concatenate the processed chunks back into a single Series
-        return pd.concat(processed_chunks)
+        # Join the processed chunks back into a single list
+        return list(chain.from_iterable(processed_chunks))
         
     @staticmethod
     def _decode_metar_series(metar_series):
-        decoded_metar_series = CycleData._parallel_process_series(metar_series, CycleData._metar_to_value_dict)
-        decoded_metar_df = pd.DataFrame(decoded_metar_series.tolist())
-        return decoded_metar_df # consider removing columns with all NaNs (check if this ever happens)
+        rows = CycleData._parallel_process_series(metar_series, CycleData._metar_to_value_dict)
+        return pd.DataFrame(rows, columns=list(_KNOWN_ATTRS))
     
     @staticmethod
     def _convert_units(decoded_metar_df):
         for column in QUANTITY_ATTRS:
-             # mask for non-NaN values, which will always be Quantity objects
-            quantity_mask = ~decoded_metar_df[column].isna()
-            if quantity_mask.any():
-                unit = decoded_metar_df[column][quantity_mask].apply(lambda x: x.units).value_counts().idxmax()
-                decoded_metar_df.loc[quantity_mask, column] = decoded_metar_df.loc[quantity_mask, column].apply(lambda x: x.to(unit).magnitude)
-                decoded_metar_df[column] = pint_pandas.PintArray(decoded_metar_df[column], dtype=unit)
+            values = decoded_metar_df[column].values
+            # missing values are nan floats, everything else is a Datatypes object
+            rows_by_unit = {}
+            first_value = None
+            for row, value in enumerate(values):
+                if not isinstance(value, float):
+                    rows_by_unit.setdefault(value._units, []).append(row)
+                    if first_value is None:
+                        first_value = value
+            if first_value is not None:
+                # use the units of the first value (pressures are always in mb)
+                units = _COLUMN_UNITS.get(type(first_value), first_value._units)
+                unit = UREG_UNITS[type(first_value).__name__][units]
+                magnitudes = np.full(len(values), nan)
+                # convert all of the values that share a unit at once
+                for src_units, rows in rows_by_unit.items():
+                    src_magnitudes = np.array([values[row]._value for row in rows])
+                    magnitudes[rows] = apply_conversion(
+                        first_value._CONV[(src_units, units)], src_magnitudes
+                    )
+                decoded_metar_df[column] = pint_pandas.PintArray(magnitudes, dtype=unit)
+        # directions were already exported as floats in degrees
+        for column in _DIRECTION_ATTRS:
+            degrees = decoded_metar_df[column].to_numpy(dtype=float, na_value=nan)
+            decoded_metar_df[column] = pint_pandas.PintArray(degrees, dtype=ureg.degree)
         return decoded_metar_df
     
     @staticmethod
-    def _set_timezone_and_sort_dataframe(decoded_metar_df, start_time, end_time, tz):
+    def _filter_by_time(decoded_metar_df, start_time, end_time):
+        # get all the rows that are within the time range
+        time_mask = (decoded_metar_df["time"] >= start_time) & (decoded_metar_df["time"] <= end_time)
+        return decoded_metar_df[time_mask].reset_index(drop=True)
+    
+    @staticmethod
+    def _sort_and_reindex(decoded_metar_df, tz):
         # convert to tz if not UTC
         if tz.upper() != "UTC" and tz.upper() != "UNIVERSAL":
             decoded_metar_df["time"] = decoded_metar_df["time"].dt.tz_convert(tz)
-        # get all the rows that are within the time range
-        time_mask = (decoded_metar_df["time"] >= start_time) & (decoded_metar_df["time"] <= end_time)
-        decoded_metar_df = decoded_metar_df[time_mask]
         # sort by time
         decoded_metar_df = decoded_metar_df.sort_values("time").reset_index(drop=True)
         return decoded_metar_df
     
-    @staticmethod
-    def _get_position(station_id):
-        try:
-            return stations[station_id].position
-        except KeyError:
-            return Point(nan, nan)
-    
     @staticmethod
     def _add_position_column(decoded_metar_df):
-        position_series = decoded_metar_df["station_id"].apply(CycleData._get_position)
-        decoded_metar_df = gpd.GeoDataFrame(decoded_metar_df, geometry=position_series)
-        decoded_metar_df.crs = "EPSG:4326"
-        return decoded_metar_df
+        station_ids = decoded_metar_df["station_id"]
+        # unknown stations get an empty (nan) position
+        station_lons, station_lats = _get_station_coordinates()
+        lons = station_ids.map(station_lons).to_numpy(dtype=float, na_value=nan)
+        lats = station_ids.map(station_lats).to_numpy(dtype=float, na_value=nan)
+        geometry = gpd.points_from_xy(lons, lats, crs="EPSG:4326")
+        return gpd.GeoDataFrame(decoded_metar_df, geometry=geometry)
     
     
     
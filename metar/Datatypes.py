@@ -3,9 +3,11 @@
 # SPDX-License-Identifier: BSD-2-Clause
 """Python classes to represent dimensioned quantities used in weather reports.
 """
+import math
 import re
-import numpy as np
-from metar.Units import ureg
+from functools import lru_cache
+from metar._units_fast import CONV, FMT, apply_conversion
+from metar._geo import bearings
 
 # exceptions
 class UnitsError(Exception):
@@ -18,136 +20,189 @@ class UnitsError(Exception):
 
 FRACTION_RE = re.compile(r"^((?P<int>\d+)\s*)?(?P<num>\d)/(?P<den>\d+)$")
 
+# In METAR world, a string of just four or three zeros denotes trace
+# precipitation (used by precipitation class)
+
+_TRACE_TOKENS = frozenset({"0000", "000"})
+
+# "M" (less than) and "P" (greater than) prefixes of distance and precipitation
+# values (used by distance and precipitation classes)
+
+_PREFIX = {"M": "<", "P": ">"}
+
 # classes representing dimensioned values in METAR reports
 
-def _add_units(instance):
-    """Add units to a value, if not already present."""
-    if not isinstance(instance._value, ureg.Quantity):
-        instance._value = ureg.Quantity(instance._value, instance.unit_ureg_dict[instance._units])
+@lru_cache(maxsize=4096)
+def _parse_float(value):
+    """Return a number string from a report as a float.
+
+    Reports reuse the same few tokens ("00", "10", "1013", ...) over and over,
+    so the conversions are cached."""
+    return float(value)
+
+def _to_float(value):
+    """Return a value given to a constructor as a float."""
+    # only strings go through the cache, other values may not be hashable
+    if isinstance(value, str):
+        return _parse_float(value)
+    return float(value)
+
+def _strip_gtlt(value, gtlt):
+    """Return the value without its M/P prefix, and the matching gtlt symbol."""
+    if isinstance(value, str):
+        prefix_gtlt = _PREFIX.get(value[:1])
+        if prefix_gtlt is not None:
+            return value[1:], prefix_gtlt
+    return value, gtlt
+
+def _convert(instance, units):
+    """Return the value of a dimensioned quantity in the given (legal) units."""
+    return apply_conversion(instance._CONV[(instance._units, units)], instance._value)
 
 def _get_unit_string(instance, unit_str, precision=1):
     """Return a string representation of the value with the given units."""
-    return f"{instance._value.to(instance.unit_ureg_dict[unit_str]):.{precision}f~P}"
+    # adding 0.0 turns a rounded -0.0 back into 0.0
+    magnitude = round(_convert(instance, unit_str), precision) + 0.0
+    return instance._FMT[(unit_str, precision)].format(magnitude)
 
 
-class temperature(object):
+class temperature:
     """A class representing a temperature value."""
 
+    __slots__ = ("_value", "_units")
+
     legal_units = ["F", "C", "K"]
-    unit_ureg_dict = {
-        "F": ureg.degF,
-        "C": ureg.degC,
-        "K": ureg.kelvin,
-    }
+    _LEGAL = frozenset(legal_units)
+
+    _CONV = CONV["temperature"]
+    _FMT = FMT["temperature"]
 
     def __init__(self, value, units="C"):
-        if not units.upper() in temperature.legal_units:
+        u = units.upper()
+        if u not in temperature._LEGAL:
             raise UnitsError("unrecognized temperature unit: '" + units + "'")
-        self._units = units.upper()
+        self._units = u
         try:
-            self._value = float(value)
-        except ValueError:
-            if value.startswith("M"):
-                self._value = -float(value[1:])
+            # an "M" prefix marks a temperature below zero
+            if isinstance(value, str) and value[:1] == "M":
+                self._value = -_parse_float(value[1:])
             else:
-                raise ValueError("temperature must be integer: '" + str(value) + "'")
-        _add_units(self)
+                self._value = _to_float(value)
+        except ValueError:
+            raise ValueError("temperature must be integer: '" + str(value) + "'")
 
     def __str__(self):
         return self.string()
     
-    def value(self):
-        """Return the temperature in its given units."""
-        return self._value
+    def value(self, units=None):
+        """Return the temperature, in the given units (defaults to its own units)."""
+        if units is None:
+            return self._value
+        u = units.upper()
+        if u not in temperature._LEGAL:
+            raise UnitsError("unrecognized temperature unit: '" + units + "'")
+        return _convert(self, u)
 
     def string(self, units=None):
         """Return a string representation of the temperature, using the given units."""
         if units is None:
             units = self._units
         else:
-            if not units.upper() in temperature.legal_units:
+            u = units.upper()
+            if u not in temperature._LEGAL:
                 raise UnitsError("unrecognized temperature unit: '" + units + "'")
-            units = units.upper()
+            units = u
         return _get_unit_string(self, units, 1)
 
 
-class pressure(object):
+class pressure:
     """A class representing a barometric pressure value."""
 
+    __slots__ = ("_value", "_units")
+
     legal_units = ["MB", "HPA", "IN"]
-    unit_ureg_dict = {
-        "MB": ureg.mbar,
-        "HPA": ureg.hectopascal,
-        "IN": ureg.inch_of_mercury,
-    }
+    _LEGAL = frozenset(legal_units)
+
+    _CONV = CONV["pressure"]
+    _FMT = FMT["pressure"]
 
     def __init__(self, value, units="MB"):
-        if not units.upper() in pressure.legal_units:
+        u = units.upper()
+        if u not in pressure._LEGAL:
             raise UnitsError("unrecognized pressure unit: '" + units + "'")
-        self._value = float(value)
-        self._units = units.upper()
-        _add_units(self)
+        self._value = _to_float(value)
+        self._units = u
 
     def __str__(self):
         return self.string()
     
-    def value(self):
-        """Return the pressure in its given units."""
-        return self._value.to(ureg.mbar)
+    def value(self, units="MB"):
+        """Return the pressure, in the given units (defaults to millibars)."""
+        u = units.upper()
+        if u not in pressure._LEGAL:
+            raise UnitsError("unrecognized pressure unit: '" + units + "'")
+        return _convert(self, u)
 
     def string(self, units=None):
         """Return a string representation of the pressure, using the given units."""
         if not units:
             units = self._units
         else:
-            if units.upper() not in pressure.legal_units:
+            u = units.upper()
+            if u not in pressure._LEGAL:
                 raise UnitsError("unrecognized pressure unit: '" + units + "'")
-            units = units.upper()
+            units = u
         return _get_unit_string(self, units, 2)
 
 
-class speed(object):
+class speed:
     """A class representing a wind speed value."""
 
+    __slots__ = ("_value", "_units", "_gtlt")
+
     legal_units = ["KT", "MPS", "KMH", "MPH"]
-    unit_ureg_dict = {
-        "KT": ureg.knot,
-        "MPS": ureg.meter / ureg.second,
-        "KMH": ureg.kilometer / ureg.hour,
-        "MPH": ureg.mile / ureg.hour,
-    }
+    _LEGAL = frozenset(legal_units)
     legal_gtlt = [">", "<"]
 
+    _CONV = CONV["speed"]
+    _FMT = FMT["speed"]
+
     def __init__(self, value, units=None, gtlt=None):
         if not units:
             self._units = "MPS"
         else:
-            if units.upper() not in speed.legal_units:
+            u = units.upper()
+            if u not in speed._LEGAL:
                 raise UnitsError("unrecognized speed unit: '" + units + "'")
-            self._units = units.upper()
+            self._units = u
         if gtlt and gtlt not in speed.legal_gtlt:
             raise ValueError(
                 "unrecognized greater-than/less-than symbol: '" + gtlt + "'"
             )
         self._gtlt = gtlt
-        self._value = float(value)
-        _add_units(self)
+        self._value = _to_float(value)
 
     def __str__(self):
         return self.string()
     
-    def value(self):
-        """Return the speed in its given units."""
-        return self._value
+    def value(self, units=None):
+        """Return the speed, in the given units (defaults to its own units)."""
+        if units is None:
+            return self._value
+        u = units.upper()
+        if u not in speed._LEGAL:
+            raise UnitsError("unrecognized speed unit: '" + units + "'")
+        return _convert(self, u)
 
     def string(self, units=None):
         """Return a string representation of the speed in the given units."""
         if not units:
             units = self._units
         else:
-            if units.upper() not in speed.legal_units:
+            u = units.upper()
+            if u not in speed._LEGAL:
                 raise UnitsError("unrecognized speed unit: '" + units + "'")
-            units = units.upper()
+            units = u
         text = _get_unit_string(self, units, 0)
         if self._gtlt == ">":
             text = "greater than " + text
@@ -156,74 +211,77 @@ class speed(object):
         return text
 
 
-class distance(object):
+class distance:
     """A class representing a distance value."""
 
+    __slots__ = ("_value", "_units", "_gtlt", "_num", "_den")
+
     legal_units = ["SM", "MI", "M", "KM", "FT", "IN"]
-    unit_ureg_dict = {
-        "SM": ureg.mile,
-        "MI": ureg.mile,
-        "M": ureg.meter,
-        "KM": ureg.kilometer,
-        "FT": ureg.foot,
-        "IN": ureg.inch,
-    }
+    _LEGAL = frozenset(legal_units)
     legal_gtlt = [">", "<"]
 
+    _CONV = CONV["distance"]
+    _FMT = FMT["distance"]
+
     def __init__(self, value, units=None, gtlt=None):
         if not units:
             self._units = "M"
         else:
-            if units.upper() not in distance.legal_units:
+            u = units.upper()
+            if u not in distance._LEGAL:
                 raise UnitsError("unrecognized distance unit: '" + units + "'")
-            self._units = units.upper()
+            self._units = u
 
-        try:
-            if value.startswith("M"):
-                value = value[1:]
-                gtlt = "<"
-            elif value.startswith("P"):
-                value = value[1:]
-                gtlt = ">"
-        except:
-            pass
+        value, gtlt = _strip_gtlt(value, gtlt)
         if gtlt and gtlt not in distance.legal_gtlt:
             raise ValueError(
                 "unrecognized greater-than/less-than symbol: '" + gtlt + "'"
             )
         self._gtlt = gtlt
-        try:
-            self._value = float(value)
+        # only fractions need the regex, everything else is a plain number
+        if isinstance(value, str) and value.isdigit():
+            self._value = _parse_float(value)
             self._num = None
             self._den = None
-        except ValueError:
+        elif isinstance(value, str) and "/" in value:
             mf = FRACTION_RE.match(value)
             if not mf:
                 raise ValueError("distance is not parseable: '" + str(value) + "'")
-            df = mf.groupdict()
-            self._num = int(df["num"])
-            self._den = int(df["den"])
+            self._num = int(mf.group("num"))
+            self._den = int(mf.group("den"))
             self._value = float(self._num) / float(self._den)
-            if df["int"]:
-                self._value += float(df["int"])
-            self._value = self._value
-        _add_units(self)
+            whole = mf.group("int")
+            if whole:
+                self._value += float(whole)
+        else:
+            try:
+                self._value = _to_float(value)
+            except ValueError:
+                raise ValueError("distance is not parseable: '" + str(value) + "'")
+            self._num = None
+            self._den = None
 
     def __str__(self):
         return self.string()
     
-    def value(self):
-        """Return the distance in its given units."""
-        return self._value
+    def value(self, units=None):
+        """Return the distance, in the given units (defaults to its own units)."""
+        if units is None:
+            return self._value
+        u = units.upper()
+        if u not in distance._LEGAL:
+            raise UnitsError("unrecognized distance unit: '" + units + "'")
+        return _convert(self, u)
 
     def string(self, units=None):
         """Return a string representation of the distance in the given units."""
         if not units:
             units = self._units
         else:
-            if not units.upper() in distance.legal_units:
+            u = units.upper()
+            if u not in distance._LEGAL:
                 raise UnitsError("unrecognized distance unit: '" + units + "'")
-            units = units.upper()
+            units = u
         text = _get_unit_string(self, units, 1)
         if self._gtlt == ">":
             text = "greater than " + text
@@ -232,9 +290,11 @@ class distance(object):
         return text
 
 
-class direction(object):
+class direction:
     """A class representing a compass direction."""
 
+    __slots__ = ("_degrees", "_compass")
+
     compass_dirs = {
         "N": 0.0,
         "NNE": 22.5,
@@ -253,6 +313,11 @@ class direction(object):
         "NW": 315.0,
         "NNW": 337.5,
     }
+    # compass points in 22.5 degree steps, starting from north
+    _COMPASS_BY_IDX = (
+        "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+        "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW",
+    )
 
     def __init__(self, d):
         if d in direction.compass_dirs:
@@ -264,8 +329,6 @@ class direction(object):
             if value < 0.0 or value > 360.0:
                 raise ValueError("direction must be 0..360: '" + str(value) + "'")
             self._degrees = value
-        self._degrees = self._degrees * ureg.degrees
-        
 
     def __str__(self):
         return self.string()
@@ -276,75 +339,68 @@ class direction(object):
 
     def string(self):
         """Return a string representation of the numerical direction."""
-        return f"{self._degrees:.1f~P}"
+        return f"{self._degrees:.1f}°"
 
     def compass(self):
         """Return the compass direction, e.g., "N", "ESE", etc.)."""
         if not self._compass:
-            degrees = 22.5 * round(self._degrees.magnitude / 22.5)
-            if degrees == 360.0:
-                self._compass = "N"
-            else:
-                for name, d in direction.compass_dirs.items():
-                    if d == degrees:
-                        self._compass = name
-                        break
+            index = int(round(self._degrees / 22.5)) % 16
+            self._compass = direction._COMPASS_BY_IDX[index]
         return self._compass
 
 
-class precipitation(object):
+class precipitation:
     """A class representing a precipitation value."""
 
+    __slots__ = ("_value", "_units", "_gtlt", "_istrace")
+
     legal_units = ["IN", "CM"]
-    unit_ureg_dict = {
-        "IN": ureg.inch,
-        "CM": ureg.centimeter,
-    }
+    _LEGAL = frozenset(legal_units)
     legal_gtlt = [">", "<"]
 
+    _CONV = CONV["precipitation"]
+    _FMT = FMT["precipitation"]
+
     def __init__(self, value, units=None, gtlt=None):
         if not units:
             self._units = "IN"
         else:
-            if not units.upper() in precipitation.legal_units:
+            u = units.upper()
+            if u not in precipitation._LEGAL:
                 raise UnitsError("unrecognized precipitation unit: '" + units + "'")
-            self._units = units.upper()
+            self._units = u
 
-        try:
-            if value.startswith("M"):
-                value = value[1:]
-                gtlt = "<"
-            elif value.startswith("P"):
-                value = value[1:]
-                gtlt = ">"
-        except:
-            pass
+        value, gtlt = _strip_gtlt(value, gtlt)
         if gtlt and gtlt not in precipitation.legal_gtlt:
             raise ValueError(
                 "unrecognized greater-than/less-than symbol: '" + gtlt + "'"
             )
         self._gtlt = gtlt
-        self._value = float(value)
-        # In METAR world, a string of just four or three zeros denotes trace
-        self._istrace = value in ["0000", "000"]
-        _add_units(self)
+        self._value = _to_float(value)
+        # checked after any M/P prefix has been stripped, so "M0000" is also a trace
+        self._istrace = isinstance(value, str) and value in _TRACE_TOKENS
 
     def __str__(self):
         return self.string()
 
-    def value(self):
-        """Return the precipitation in its given units."""
-        return self._value
-        
+    def value(self, units=None):
+        """Return the precipitation, in the given units (defaults to its own units)."""
+        if units is None:
+            return self._value
+        u = units.upper()
+        if u not in precipitation._LEGAL:
+            raise UnitsError("unrecognized precipitation unit: '" + units + "'")
+        return _convert(self, u)
 
     def string(self, units=None):
         """Return a string representation of the precipitation in the given units."""
         if not units:
             units = self._units
         else:
-            if not units.upper() in precipitation.legal_units:
+            u = units.upper()
+            if u not in precipitation._LEGAL:
                 raise UnitsError("unrecognized precipitation unit: '" + units + "'")
-            units = units.upper()
+            units = u
         # A trace is a trace in any units
         if self._istrace:
             return "Trace"
@@ -360,12 +416,17 @@ class precipitation(object):
         return self._istrace
 
 
-class position(object):
+class position:
     """A class representing a location on the earth's surface."""
 
+    __slots__ = ("latitude", "longitude", "_lat_rad", "_lon_rad")
+
     def __init__(self, latitude=None, longitude=None):
         self.latitude = latitude
         self.longitude = longitude
+        # the great-circle calculations work in radians
+        self._lat_rad = None if latitude is None else math.radians(float(latitude))
+        self._lon_rad = None if longitude is None else math.radians(float(longitude))
 
     def __str__(self):
         return self.string()
@@ -380,16 +441,9 @@ class position(object):
         typically changes as you trace the great circle path to that location.)
         See <http://www.movable-type.co.uk/scripts/LatLong.html>.
         """
-        lat1 = self.latitude
-        long1 = self.longitude
-        lat2 = position2.latitude
-        long2 = position2.longitude
-        s = -np.sin(long1 - long2) * np.cos(lat2)
-        c = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(long1 - long2)
-        d = np.arctan2(s, c) * 180.0 / np.pi    
-        if d < 0.0:
-            d += 360.0
-        return direction(d)
+        return direction(
+            bearings(self._lat_rad, self._lon_rad, position2._lat_rad, position2._lon_rad)
+        )
 
 # define a list of the different types
 metar_types = [
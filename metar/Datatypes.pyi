@@ -1,40 +1,56 @@
 from typing import Literal, Optional, Union
-from metar.Units import Quantity
 
 GreaterOrLess = Literal[">", "<"]
 Value = Union[str, float]
 
+_TRACE_TOKENS: frozenset[str]
+_PREFIX: dict[str, GreaterOrLess]
+
 TemperatureUnit = Literal["F", "C", "K", "f", "c", "k"]
 
-def _add_units(instance: object) -> None: ...
+def _parse_float(value: str) -> float: ...
+def _to_float(value: Value) -> float: ...
+def _strip_gtlt(
+    value: Value, gtlt: Optional[GreaterOrLess]
+) -> tuple[Value, Optional[GreaterOrLess]]: ...
+def _convert(instance: object, units: str) -> float: ...
 
 def _get_unit_string(instance: object, unit_str: str, precision: int = 1) -> str: ...
 
 class temperature:
     _units: TemperatureUnit
-    _value: Quantity
+    _value: float
+    _LEGAL: frozenset[str]
+    _CONV: dict[tuple[str, str], tuple[float, float, float, float]]
+    _FMT: dict[tuple[str, int], str]
 
     def __init__(self, value: Value, units: TemperatureUnit = "C") -> None: ...
     def __str__(self) -> str: ...
-    def value(self) -> Quantity: ...
+    def value(self, units: Optional[TemperatureUnit] = None) -> float: ...
     def string(self, units: Optional[TemperatureUnit] = None) -> str: ...
 
 PressureUnit = Literal["MB", "HPA", "IN", "mb", "hPa", "in"]
 
 class pressure:
     _units: PressureUnit
-    _value: Quantity
+    _value: float
+    _LEGAL: frozenset[str]
+    _CONV: dict[tuple[str, str], tuple[float, float, float, float]]
+    _FMT: dict[tuple[str, int], str]
 
     def __init__(self, value: Value, units: PressureUnit = "MB") -> None: ...
     def __str__(self) -> str: ...
-    def value(self) -> Quantity: ...
+    def value(self, units: PressureUnit = "MB") -> float: ...
     def string(self, units: Optional[PressureUnit] = None) -> str: ...
 
 SpeedUnit = Literal["KT", "MPS", "KMH", "MPH", "kt", "mps", "kmh", "mph"]
 
 class speed:
     _units: SpeedUnit
-    _value: Quantity
+    _value: float
+    _LEGAL: frozenset[str]
+    _CONV: dict[tuple[str, str], tuple[float, float, float, float]]
+    _FMT: dict[tuple[str, int], str]
     _gtlt: GreaterOrLess
 
     def __init__(
@@ -44,7 +60,7 @@ class speed:
         gtlt: Optional[GreaterOrLess] = None,
     ) -> None: ...
     def __str__(self) -> str: ...
-    def value(self) -> Quantity: ...
+    def value(self, units: Optional[SpeedUnit] = None) -> float: ...
     def string(self, units: Optional[SpeedUnit] = None) -> str: ...
 
 DistanceUnit = Literal[
@@ -53,7 +69,10 @@ DistanceUnit = Literal[
 
 class distance:
     _units: DistanceUnit
-    _value: Quantity
+    _value: float
+    _LEGAL: frozenset[str]
+    _CONV: dict[tuple[str, str], tuple[float, float, float, float]]
+    _FMT: dict[tuple[str, int], str]
     _gtlt: GreaterOrLess
     _num: Optional[int]
     _den: Optional[int]
@@ -65,7 +84,7 @@ class distance:
         gtlt: Optional[GreaterOrLess] = None,
     ) -> None: ...
     def __str__(self) -> str: ...
-    def value(self) -> Quantity: ...
+    def value(self, units: Optional[DistanceUnit] = None) -> float: ...
     def string(self, units: Optional[DistanceUnit] = None) -> str: ...
 
 CompassDirection = Literal[
@@ -89,22 +108,25 @@ CompassDirection = Literal[
 
 class direction:
     _compass: Optional[CompassDirection]
-    _degrees: Quantity
+    _degrees: float
 
     def __init__(
         self,
         d: Union[CompassDirection, Value],
     ): ...
     def __str__(self) -> str: ...
-    def value(self) -> Quantity: ...
+    def value(self) -> float: ...
     def string(self) -> str: ...
     def compass(self) -> CompassDirection: ...
 
 PrecipitationUnit = Literal["IN", "CM", "in", "cm"]
 
-class precipitation(object):
+class precipitation:
     _units: PrecipitationUnit
-    _value: Quantity
+    _value: float
+    _LEGAL: frozenset[str]
+    _CONV: dict[tuple[str, str], tuple[float, float, float, float]]
+    _FMT: dict[tuple[str, int], str]
     _gtlt: GreaterOrLess
     _istrace: bool
 
@@ -115,13 +137,15 @@ class precipitation(object):
         gtlt: Optional[GreaterOrLess] = None,
     ) -> None: ...
     def __str__(self) -> str: ...
-    def value(self) -> Quantity: ...
+    def value(self, units: Optional[PrecipitationUnit] = None) -> float: ...
     def string(self, units: Optional[PrecipitationUnit] = None) -> str: ...
     def istrace(self) -> bool: ...
 
 class position:
     latitude: Optional[float]
     longitude: Optional[float]
+    _lat_rad: Optional[float]
+    _lon_rad: Optional[float]
 
     def __init__(
         self, latitude: Optional[float] = None, longitude: Optional[float] = None
@@ -18,7 +18,6 @@ from metar.Datatypes import (
     direction,
     precipitation
 )
-from metar.Units import ureg
 from numpy import nan
 from pandas import Timedelta, Timestamp, NaT, isna
 
@@ -1205,7 +1204,7 @@ class Metar(object):
         """
         if isna(self.wind_speed):
             return "missing"
-        elif self.wind_speed.value().magnitude == 0.0:
+        elif self.wind_speed.value() == 0.0:
             text = "calm"
         else:
             wind_speed = self.wind_speed.string(units)
@@ -1231,7 +1230,7 @@ class Metar(object):
         """
         if isna(self.wind_speed_peak):
             return "missing"
-        elif self.wind_speed_peak.value().magnitude == 0.0:
+        elif self.wind_speed_peak.value() == 0.0:
             text = "calm"
         else:
             wind_speed = self.wind_speed_peak.string(units)
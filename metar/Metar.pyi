@@ -10,7 +10,6 @@ from metar.Datatypes import (
     temperature,
 )
 
-from metar.Units import ureg
 from numpy import nan
 from pandas import Timedelta, Timestamp, NaT
 
@@ -2,15 +2,26 @@
 # Distributed under the terms of the BSD 2-Clause License.
 # SPDX-License-Identifier: BSD-2-Clause
 """Python module to provide station information from the ICAO identifiers."""
+import hashlib
 import os
-from shapely.geometry import Point
+from functools import lru_cache
+import numpy as np
 from numpy import nan
-import json
+import pickle
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 
 class station:
     """An object representing a weather station."""
 
+    __slots__ = (
+        "id", "name", "state", "country", "latitude", "longitude", "_position", "_in_table"
+    )
+
     def __init__(
         self, id, name = None, state=None, country=None, latitude=nan, longitude=nan
     ):
@@ -18,19 +29,118 @@ class station:
         self.name = name
         self.state = state
         self.country = country
-        self.position = Point(float(longitude), float(latitude))
+        self.latitude = float(latitude)
+        self.longitude = float(longitude)
+        self._position = None
+        # set by get_stations for the stations of the known stations table
+        self._in_table = False
+
+    @property
+    def position(self):
+        """The location of the station as a shapely Point, built on first use."""
+        if self._position is None:
+            if self._in_table:
+                _build_positions()
+            else:
+                import shapely
+
+                self._position = shapely.points(self.longitude, self.latitude)
+        return self._position
 
 
 
 current_dir = os.path.dirname(__file__)
 station_file_name = os.path.join(current_dir, ".stations.json")
+# bump when the layout of the cached station rows changes
+_STATION_CACHE_VERSION = 1
+
+
+def _station_cache_file_names(json_file_name):
+    """Return the paths where the parsed rows of a station file may be cached.
+
+    The cache is kept beside the json file, or in the user's cache directory
+    (under a name unique to the json file) when the package is read-only."""
+    json_file_name = os.path.abspath(json_file_name)
+    digest = hashlib.sha1(json_file_name.encode()).hexdigest()[:16]
+    return [
+        os.path.join(os.path.dirname(json_file_name), ".stations.pkl"),
+        os.path.join(
+            os.path.expanduser("~"), ".cache", "python-metar", f"stations-{digest}.pkl"
+        ),
+    ]
+
+
+def _station_cache_key(json_file_name):
+    """Return what a cache must have been built from to be valid for the json file."""
+    info = os.stat(json_file_name)
+    return (
+        _STATION_CACHE_VERSION,
+        os.path.abspath(json_file_name),
+        info.st_size,
+        info.st_mtime_ns,
+    )
 
-stations = {}
 
-# open json file
-with open(station_file_name) as f:
-    data = json.load(f)
+def _load_stations():
+    """Return the (id, name, state, country, latitude, longitude) of every station.
+
+    Parsing the json file is slow, so the rows are cached as a pickle, which is
+    only used if it was built from this very json file."""
+    key = _station_cache_key(station_file_name)
+    cache_file_names = _station_cache_file_names(station_file_name)
+    for cache_file_name in cache_file_names:
+        try:
+            with open(cache_file_name, "rb") as f:
+                cache_key, rows = pickle.load(f)
+            if cache_key == key:
+                return rows
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            pass
+
+    # open json file
+    with open(station_file_name, "rb") as f:
+        data = _json.loads(f.read())
+    rows = [
+        (set['icaoId'], set['site'], set['state'], set['country'], set['lat'], set['lon'])
+        for set in data
+    ]
+    for cache_file_name in cache_file_names:
+        try:
+            os.makedirs(os.path.dirname(cache_file_name), exist_ok=True)
+            # write to a temporary file first so that readers never see a partial file
+            tmp_file_name = f"{cache_file_name}.{os.getpid()}.tmp"
+            with open(tmp_file_name, "wb") as f:
+                pickle.dump((key, rows), f, protocol=5)
+            os.replace(tmp_file_name, cache_file_name)
+            break
+        except OSError:
+            pass
+    return rows
+
+
+def _build_positions():
+    """Build the Points of all the known stations in a single vectorized call."""
+    import shapely
+
+    known = list(get_stations().values())
+    lons = np.array([s.longitude for s in known], dtype=np.float64)
+    lats = np.array([s.latitude for s in known], dtype=np.float64)
+    for s, point in zip(known, shapely.points(lons, lats)):
+        s._position = point
+
+
+@lru_cache(maxsize=None)
+def get_stations():
+    """Return the known stations keyed by ICAO id, loading them on first use."""
     # set stations with data from json file
-    for set in data:
-        stations[set['icaoId']] = station(set['icaoId'], set['site'], set['state'], set['country'], set['lat'], set['lon'])
-    
+    stations = {row[0]: station(*row) for row in _load_stations()}
+    for s in stations.values():
+        s._in_table = True
+    return stations
+
+
+def __getattr__(name):
+    # the stations table is loaded when it is first accessed, not on import
+    if name == "stations":
+        return get_stations()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,6 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-from metar.Datatypes import position
+from shapely.geometry import Point
 
 class station:
     id: str
@@ -8,7 +8,12 @@ class station:
     city: Optional[str]
     state: Optional[str]
     country: Optional[str]
-    position: position
+    latitude: float
+    longitude: float
+    _position: Optional[Point]
+    _in_table: bool
+    @property
+    def position(self) -> Point: ...
 
     def __init__(
         self,
@@ -20,4 +25,16 @@ class station:
         longitude: Optional[str] = None,
     ): ...
 
+current_dir: str
+station_file_name: str
+_STATION_CACHE_VERSION: int
+
+def _station_cache_file_names(json_file_name: str) -> List[str]: ...
+def _station_cache_key(json_file_name: str) -> Tuple[int, str, int, int]: ...
+
+def _load_stations() -> List[Tuple[str, str, str, str, float, float]]: ...
+def _build_positions() -> None: ...
+
+def get_stations() -> Dict[str, station]: ...
+
 stations: Dict[str, station]
@@ -6,3 +6,25 @@ ureg = UnitRegistry()
 # Define custom units
 ureg.define('inch_of_mercury = 33.8639 millibar = inHg')  # Define inches of mercury
 
+
+# pint units matching the unit codes of each kind of value in metar.Datatypes,
+# for callers that want the values as pint quantities
+UREG_UNITS = {
+    "temperature": {"F": ureg.degF, "C": ureg.degC, "K": ureg.kelvin},
+    "pressure": {"MB": ureg.mbar, "HPA": ureg.hectopascal, "IN": ureg.inch_of_mercury},
+    "speed": {
+        "KT": ureg.knot,
+        "MPS": ureg.parse_units("m/s"),
+        "KMH": ureg.parse_units("km/h"),
+        "MPH": ureg.parse_units("mi/h"),
+    },
+    "distance": {
+        "SM": ureg.mile,
+        "MI": ureg.mile,
+        "M": ureg.meter,
+        "KM": ureg.kilometer,
+        "FT": ureg.foot,
+        "IN": ureg.inch,
+    },
+    "precipitation": {"IN": ureg.inch, "CM": ureg.centimeter},
+}
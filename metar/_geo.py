@@ -0,0 +1,51 @@
+# Copyright (c) 2004,2018 Python-Metar Developers.
+# Distributed under the terms of the BSD 2-Clause License.
+# SPDX-License-Identifier: BSD-2-Clause
+"""Great-circle calculations between locations on the earth's surface.
+
+The kernels are compiled with numba when it is installed, and fall back to
+the math module (and NumPy for batches) otherwise.
+"""
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _bearing(lat1, lon1, lat2, lon2):
+    """
+    Return the initial bearing in degrees, from 0 up to 360, from the first
+    location to the second.  Latitudes and longitudes are in radians.
+    See <http://www.movable-type.co.uk/scripts/LatLong.html>.
+    """
+    s = -math.sin(lon1 - lon2) * math.cos(lat2)
+    c = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(
+        lon1 - lon2
+    )
+    # the modulo also turns a -0.0 from atan2 (e.g. due north) into 0.0
+    return math.degrees(math.atan2(s, c)) % 360.0
+
+
+if njit is not None:
+    bearings = njit(cache=True, fastmath=True)(_bearing)
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def bearings_batch(lat1, lon1, lat2, lon2):
+        """Return the initial bearings, in degrees, between arrays of locations."""
+        n = lat1.shape[0]
+        out = np.empty(n)
+        for i in prange(n):
+            out[i] = bearings(lat1[i], lon1[i], lat2[i], lon2[i])
+        return out
+
+else:
+    bearings = _bearing
+
+    def bearings_batch(lat1, lon1, lat2, lon2):
+        """Return the initial bearings, in degrees, between arrays of locations."""
+        s = -np.sin(lon1 - lon2) * np.cos(lat2)
+        c = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(lon1 - lon2)
+        return np.degrees(np.arctan2(s, c)) % 360.0
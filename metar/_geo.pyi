@@ -0,0 +1,11 @@
+import numpy as np
+import numpy.typing as npt
+
+def _bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float: ...
+def bearings(lat1: float, lon1: float, lat2: float, lon2: float) -> float: ...
+def bearings_batch(
+    lat1: npt.NDArray[np.float64],
+    lon1: npt.NDArray[np.float64],
+    lat2: npt.NDArray[np.float64],
+    lon2: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]: ...
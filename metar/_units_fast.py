@@ -0,0 +1,98 @@
+# Copyright (c) 2004,2018 Python-Metar Developers.
+# Distributed under the terms of the BSD 2-Clause License.
+# SPDX-License-Identifier: BSD-2-Clause
+"""Conversion tables for the fixed set of units used in weather reports.
+
+Every conversion is a linear function, stored as a (src_zero, num, den,
+dst_zero) tuple that takes a value in the source units to the destination
+units as (value - src_zero) * num / den + dst_zero.  Keeping the numerator
+and denominator apart means that conversions such as 50 F to 10 C come out
+exact, instead of picking up rounding errors from a combined factor.
+"""
+
+# each unit as a (zero, num, den) tuple relative to a reference unit of its kind
+# (celsius, millibars, meters per second, meters and inches respectively),
+# so that value_in_reference = (value - zero) * num / den
+
+_UNITS = {
+    "temperature": {
+        "F": (32.0, 1.0, 1.8),
+        "C": (0.0, 1.0, 1.0),
+        "K": (273.15, 1.0, 1.0),
+    },
+    "pressure": {
+        "MB": (0.0, 1.0, 1.0),
+        "HPA": (0.0, 1.0, 1.0),
+        "IN": (0.0, 33.8639, 1.0),
+    },
+    "speed": {
+        "KT": (0.0, 1852.0, 3600.0),
+        "MPS": (0.0, 1.0, 1.0),
+        "KMH": (0.0, 1000.0, 3600.0),
+        "MPH": (0.0, 1609.344, 3600.0),
+    },
+    "distance": {
+        "SM": (0.0, 1609.344, 1.0),
+        "MI": (0.0, 1609.344, 1.0),
+        "M": (0.0, 1.0, 1.0),
+        "KM": (0.0, 1000.0, 1.0),
+        "FT": (0.0, 0.3048, 1.0),
+        "IN": (0.0, 0.0254, 1.0),
+    },
+    "precipitation": {
+        "IN": (0.0, 1.0, 1.0),
+        "CM": (0.0, 1.0, 2.54),
+    },
+}
+
+# symbols used when printing values in each unit
+
+SYMBOL = {
+    "temperature": {"F": "°F", "C": "°C", "K": "K"},
+    "pressure": {"MB": "mbar", "HPA": "hPa", "IN": "inHg"},
+    "speed": {"KT": "kn", "MPS": "m/s", "KMH": "km/h", "MPH": "mi/h"},
+    "distance": {"SM": "mi", "MI": "mi", "M": "m", "KM": "km", "FT": "ft", "IN": "in"},
+    "precipitation": {"IN": "in", "CM": "cm"},
+}
+
+# format strings for printing a value in each unit, keyed by (unit, precision)
+
+FMT = {
+    kind: {
+        (units, precision): f"{{:.{precision}f}} {symbol}"
+        for units, symbol in symbols.items()
+        for precision in range(3)
+    }
+    for kind, symbols in SYMBOL.items()
+}
+
+
+def _build_conversions(units):
+    """Return the conversions between every pair of units of one kind."""
+    conversions = {}
+    for src, (src_zero, src_num, src_den) in units.items():
+        for dst, (dst_zero, dst_num, dst_den) in units.items():
+            if src == dst:
+                conversions[(src, dst)] = (0.0, 1.0, 1.0, 0.0)
+            else:
+                conversions[(src, dst)] = (
+                    src_zero,
+                    src_num * dst_den,
+                    src_den * dst_num,
+                    dst_zero,
+                )
+    return conversions
+
+
+CONV = {kind: _build_conversions(units) for kind, units in _UNITS.items()}
+
+
+def apply_conversion(conversion, val):
+    """Apply a conversion from CONV to a value, or to a NumPy array of values."""
+    src_zero, num, den, dst_zero = conversion
+    return (val - src_zero) * num / den + dst_zero
+
+
+def convert(kind, val, src, dst):
+    """Convert a value of the given kind (e.g., "speed") between two unit codes."""
+    return apply_conversion(CONV[kind][(src, dst)], val)
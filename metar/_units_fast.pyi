@@ -0,0 +1,19 @@
+from typing import Literal, TypeVar
+
+import numpy as np
+
+Kind = Literal["temperature", "pressure", "speed", "distance", "precipitation"]
+_V = TypeVar("_V", float, np.ndarray)
+
+_UNITS: dict[Kind, dict[str, tuple[float, float, float]]]
+SYMBOL: dict[Kind, dict[str, str]]
+FMT: dict[Kind, dict[tuple[str, int], str]]
+CONV: dict[Kind, dict[tuple[str, str], tuple[float, float, float, float]]]
+
+def _build_conversions(
+    units: dict[str, tuple[float, float, float]]
+) -> dict[tuple[str, str], tuple[float, float, float, float]]: ...
+def apply_conversion(
+    conversion: tuple[float, float, float, float], val: _V
+) -> _V: ...
+def convert(kind: Kind, val: float, src: str, dst: str) -> float: ...
@@ -32,7 +32,7 @@ required = ["mypy==1.3.0",
             "pandas>=2.0",
             "geopandas>=0.14",
             "pint-pandas>=0.4",
-            "aiohttp>=3.0"]
+            "httpx[http2]>=0.23"]
 
 setup(
     name="metar",
@@ -46,7 +46,11 @@ setup(
     packages=["metar"],
     package_data={"metar": [".stations.json", "py.typed", "*.pyi"]},
     platforms="Python 2.5 and later.",
-    extras_require={"test": ["pytest"]},
+    extras_require={
+        "test": ["pytest"],
+        "numba": ["numba>=0.57"],
+        "orjson": ["orjson>=3.0"],
+    },
     install_requires=required,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,169 @@
+"""Test metar/CycleData.py."""
+import asyncio
+import os
+from functools import partial
+
+import httpx
+import pandas as pd
+from metar import CycleData as cycledata
+from metar.CycleData import CycleData
+
+REPORTS = pd.Series(
+    [
+        "KEWR 142355Z 27010KT 10SM CLR 12/05 A3001",
+        "EGLL 142350Z 18005KT 9999 FEW025 11/07 Q1013",
+    ],
+    dtype=object,
+)
+
+
+def test_convert_units():
+    """Quantity and direction columns become pint arrays."""
+    df = CycleData._convert_units(CycleData._decode_metar_series(REPORTS))
+    assert str(df["press"].dtype) == "pint[millibar][Float64]"
+    assert abs(df["press"].pint.magnitude[0] - 1016.26) < 0.01
+    assert df["press"].pint.magnitude[1] == 1013.0
+    assert str(df["wind_dir"].dtype) == "pint[degree][Float64]"
+    assert list(df["wind_dir"].pint.magnitude) == [270.0, 180.0]
+
+
+def _use_mock_transport(monkeypatch):
+    """Make the shared client answer every request with an empty cycle file."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=""))
+    monkeypatch.setattr(httpx, "AsyncClient", partial(httpx.AsyncClient, transport=transport))
+    monkeypatch.setattr(cycledata, "_CLIENT", None)
+    monkeypatch.setattr(cycledata, "_CLIENT_LOOP", None)
+    monkeypatch.setattr(cycledata, "_CLIENT_CLOSER", None)
+
+
+def test_client_reused_within_event_loop(monkeypatch):
+    """The shared client is reused for as long as its event loop runs."""
+    _use_mock_transport(monkeypatch)
+
+    async def get_clients():
+        return await cycledata._get_client(), await cycledata._get_client()
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+
+
+def test_client_closed_with_event_loop(monkeypatch):
+    """The shared client is closed when asyncio.run shuts its loop down."""
+    _use_mock_transport(monkeypatch)
+    first = asyncio.run(cycledata._get_client())
+    assert first.is_closed
+    second = asyncio.run(cycledata._get_client())
+    assert second is not first
+    assert second.is_closed
+
+
+def test_stale_client_closed(monkeypatch):
+    """A client left open by a loop that wasn't shut down is closed on replacement."""
+    _use_mock_transport(monkeypatch)
+    loop = asyncio.new_event_loop()
+    first = loop.run_until_complete(cycledata._get_client())
+    loop.close()
+    assert not first.is_closed
+    asyncio.run(cycledata._get_client())
+    assert first.is_closed
+
+
+def _kept(reports, start_time, end_time, now):
+    """Return the reports kept by CycleData._drop_reports_outside_range."""
+    series = pd.Series(reports, dtype=object)
+    kept = CycleData._drop_reports_outside_range(
+        series, pd.Timestamp(start_time), pd.Timestamp(end_time), pd.Timestamp(now)
+    )
+    return list(kept)
+
+
+def test_drop_reports_previous_month():
+    """Days after today are taken to be from the previous month."""
+    now = "2024-03-02 12:00Z"
+    reports = ["KEWR 282355Z 27010KT", "KEWR 022355Z 27010KT"]
+    # 28 February is in range, while 2 March 23:55 is still in the future
+    assert _kept(reports, "2024-02-28 00:00Z", now, now) == reports[:1]
+
+
+def test_drop_reports_january():
+    """In January, days after today are from December of the previous year."""
+    now = "2024-01-02 12:00Z"
+    reports = ["KEWR 312355Z 27010KT", "KEWR 302355Z 27010KT"]
+    assert _kept(reports, "2023-12-31 00:00Z", now, now) == reports[:1]
+
+
+def test_drop_reports_without_time():
+    """Reports whose time can't be read are left for the full parser."""
+    now = "2024-03-02 12:00Z"
+    reports = ["KEWR 27010KT 10SM", "KEWR 022399Z 27010KT", "NIL", ""]
+    assert _kept(reports, "2024-03-01 00:00Z", now, now) == reports
+
+
+def test_drop_reports_inclusive_bounds():
+    """Reports at exactly the start or end time are kept."""
+    now = "2024-03-02 12:00Z"
+    reports = [
+        "KEWR 011159Z 27010KT",
+        "KEWR 011200Z 27010KT",
+        "KEWR 021200Z 27010KT",
+        "KEWR 021201Z 27010KT",
+    ]
+    assert _kept(reports, "2024-03-01 12:00Z", now, now) == reports[1:3]
+
+
+class _FakeClient:
+    """Answer every request with a cycle file naming the url and the client."""
+
+    def __init__(self, name):
+        self.name = name
+        self.urls = []
+
+    async def get(self, url):
+        self.urls.append(url)
+        return httpx.Response(200, text=f"{url} from {self.name}")
+
+
+def test_fetch_cycle_data_cache(monkeypatch, tmp_path):
+    """Only the complete cycles of the last day are served from disk."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(cycledata, "_CACHE_DIR", str(tmp_path / "cache"))
+    current_cycle = pd.Timestamp("2024-03-02 12:00Z")
+    cycles = pd.date_range(current_cycle - pd.Timedelta(hours=24), current_cycle, freq="h")
+
+    def fetch_all(client):
+        async def fetch():
+            return await asyncio.gather(
+                *(CycleData._fetch_cycle_data(client, cycle, current_cycle) for cycle in cycles)
+            )
+
+        return asyncio.run(fetch())
+
+    # cycles too old to be read again are pruned, other files are left alone
+    (tmp_path / "cache").mkdir()
+    stale = tmp_path / "cache" / f"{cycles[0] - pd.Timedelta(hours=1):%Y%m%d_%H}Z.txt.gz"
+    stale.write_bytes(b"")
+    other = tmp_path / "cache" / "stations-0123456789abcdef.pkl"
+    other.write_bytes(b"")
+    first = fetch_all(_FakeClient("first"))
+    assert not stale.exists()
+    other.unlink()
+    client = _FakeClient("second")
+    second = fetch_all(client)
+    # the current cycle and the cycle a day back, which shares its file, are refetched
+    assert len(client.urls) == 2
+    assert all(url.endswith("/12Z.TXT") for url in client.urls)
+    assert second[1:-1] == first[1:-1]
+    assert second[0] != first[0] and second[-1] != first[-1]
+    cached = sorted(path.name for path in (tmp_path / "cache").iterdir())
+    assert cached == [f"{cycle:%Y%m%d_%H}Z.txt.gz" for cycle in cycles[1:-1]]
+
+
+def test_write_cycle_cache_failure(monkeypatch, tmp_path):
+    """A failed write leaves no temporary file behind."""
+    monkeypatch.setattr(cycledata, "_CACHE_DIR", str(tmp_path))
+    current_cycle = pd.Timestamp("2024-03-02 12:00Z")
+    cache_path = CycleData._cycle_cache_path(current_cycle - pd.Timedelta(hours=1))
+    # the temporary file can't replace a directory
+    os.mkdir(cache_path)
+    CycleData._write_cycle_cache(cache_path, "text", current_cycle)
+    assert os.listdir(tmp_path) == [os.path.basename(cache_path)]
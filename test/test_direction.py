@@ -44,6 +44,8 @@ def test_conversion():
     assert direction("0").compass() == "N"
     assert direction("5").compass() == "N"
     assert direction("355").compass() == "N"
+    assert direction("360").compass() == "N"
     assert direction("20").compass() == "NNE"
     assert direction("60").compass() == "ENE"
     assert direction("247.5").compass() == "WSW"
+    assert direction("337.5").compass() == "NNW"
@@ -0,0 +1,42 @@
+"""Test position."""
+
+import math
+
+import numpy as np
+from metar._geo import bearings, bearings_batch
+from metar.Datatypes import position
+
+
+def test_getdirection():
+    """Test the initial direction between two locations, given in degrees."""
+    origin = position(0.0, 0.0)
+    assert origin.getdirection(position(10.0, 0.0)).compass() == "N"
+    assert origin.getdirection(position(0.0, 10.0)).compass() == "E"
+    assert origin.getdirection(position(-10.0, 0.0)).compass() == "S"
+    assert origin.getdirection(position(0.0, -10.0)).compass() == "W"
+    # Boston to London
+    bearing = position(42.36, -71.06).getdirection(position(51.51, -0.13)).value()
+    assert abs(bearing - 53.1) < 0.1
+
+
+def test_getdirection_due_north():
+    """Due north is 0 degrees, not -0."""
+    direction = position(40.0, -74.0).getdirection(position(41.0, -74.0))
+    assert direction.string() == "0.0°"
+    assert math.copysign(1.0, direction.value()) == 1.0
+    direction = position(40.0, -74.0).getdirection(position(40.0, -74.0))
+    assert direction.string() == "0.0°"
+
+
+def test_bearings_batch():
+    """The batch kernel gives the same bearings as the scalar one."""
+    rng = np.random.default_rng(0)
+    lat1, lat2 = np.radians(rng.uniform(-89.0, 89.0, (2, 100)))
+    lon1, lon2 = np.radians(rng.uniform(-180.0, 180.0, (2, 100)))
+    # include due north, due south and zero-length pairs
+    lat1[:3], lon1[:3] = np.radians(40.0), np.radians(-74.0)
+    lat2[:3], lon2[:3] = np.radians([41.0, 39.0, 40.0]), np.radians(-74.0)
+    batch = bearings_batch(lat1, lon1, lat2, lon2)
+    assert batch[0] == 0.0 and math.copysign(1.0, batch[0]) == 1.0
+    for i, bearing in enumerate(batch):
+        assert abs(bearing - bearings(lat1[i], lon1[i], lat2[i], lon2[i])) < 1e-9
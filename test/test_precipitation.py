@@ -1,4 +1,5 @@
 """Test precipitation."""
+import numpy as np
 from metar.Datatypes import precipitation
 
 
@@ -7,3 +8,17 @@ def test_trace():
     assert precipitation("0000", "IN").string() == "Trace"
     assert precipitation("0000", "IN").istrace()
     assert not precipitation("0010", "IN").istrace()
+
+
+def test_gtlt_prefix():
+    """Test the M (less than) and P (greater than) value prefixes"""
+    assert precipitation("M0.01", "IN").string().startswith("less than ")
+    assert precipitation("P2", "IN").string().startswith("greater than ")
+    assert precipitation("P2", "IN").value() == 2.0
+    assert precipitation(0.5, "IN").value() == 0.5
+
+
+def test_array_input():
+    """Test that non-string, unhashable numbers are accepted."""
+    assert precipitation(np.array(0.5)).value() == 0.5
+    assert not precipitation(np.array(0.5)).istrace()
@@ -57,3 +57,10 @@ def test_conversions():
     assert pressure("1000", "mb").value("hPa"), 1000.0
     assert abs(pressure("1000", "mb").value("in") - 29.5299) < 0.0001
     assert abs(pressure("1000", "hPa").value("in") - 29.5299) < 0.0001
+
+
+def test_value_defaults_to_millibars():
+    """Test that value() without units is in millibars."""
+    assert abs(pressure("30.00", "IN").value() - 1015.917) < 0.001
+    assert pressure("1013", "HPA").value() == 1013.0
+    assert pressure("1013").value() == 1013.0
@@ -1,4 +1,7 @@
 """Test metar/Station.py."""
+import json
+
+import pytest
 from metar import Station
 
 
@@ -6,3 +9,84 @@ def test_station():
     """Can we build a station object."""
     st = Station.station("KDSM")
     assert st.id == "KDSM"
+
+
+def _write_station_file(path, ids):
+    path.write_text(
+        json.dumps(
+            [
+                {"icaoId": id, "site": id, "state": "--", "country": "US", "lat": 1, "lon": 2}
+                for id in ids
+            ]
+        )
+    )
+
+
+def test_station_cache(tmp_path, monkeypatch):
+    """The station cache is only used for the json file it was built from."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    first = tmp_path / "first" / ".stations.json"
+    second = tmp_path / "second" / ".stations.json"
+    first.parent.mkdir()
+    second.parent.mkdir()
+    _write_station_file(first, ["KAAA"])
+    _write_station_file(second, ["KBBB", "KCCC"])
+
+    monkeypatch.setattr(Station, "station_file_name", str(first))
+    assert [row[0] for row in Station._load_stations()] == ["KAAA"]
+    assert (first.parent / ".stations.pkl").exists()
+    # the cache is used as long as the json file is unchanged
+    monkeypatch.setattr(Station, "_json", None)
+    assert [row[0] for row in Station._load_stations()] == ["KAAA"]
+    monkeypatch.setattr(Station, "_json", json)
+
+    # another install doesn't see the first install's cache
+    monkeypatch.setattr(Station, "station_file_name", str(second))
+    assert [row[0] for row in Station._load_stations()] == ["KBBB", "KCCC"]
+
+    # a changed json file or cache format invalidates the cache
+    monkeypatch.setattr(Station, "station_file_name", str(first))
+    _write_station_file(first, ["KDDD", "KEEE"])
+    assert [row[0] for row in Station._load_stations()] == ["KDDD", "KEEE"]
+    monkeypatch.setattr(Station, "_STATION_CACHE_VERSION", Station._STATION_CACHE_VERSION + 1)
+    # without a json parser, only a valid cache could be loaded
+    monkeypatch.setattr(Station, "_json", None)
+    with pytest.raises(AttributeError):
+        Station._load_stations()
+
+
+def test_station_cache_names():
+    """Different station files are cached under different user cache names."""
+    first = Station._station_cache_file_names("/a/.stations.json")
+    second = Station._station_cache_file_names("/b/.stations.json")
+    assert first[0] == "/a/.stations.pkl"
+    assert first[1] != second[1]
+
+
+def test_position_without_table(monkeypatch):
+    """A station that isn't in the table builds its own position."""
+
+    def get_stations():
+        raise AssertionError("the stations table was loaded")
+
+    monkeypatch.setattr(Station, "get_stations", get_stations)
+    position = Station.station("KDSM", latitude=41.5, longitude=-93.7).position
+    assert (position.x, position.y) == (-93.7, 41.5)
+
+
+def test_position_in_table(tmp_path, monkeypatch):
+    """The positions of all stations in the table are built at once."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    file_name = tmp_path / ".stations.json"
+    _write_station_file(file_name, ["KAAA", "KBBB"])
+    monkeypatch.setattr(Station, "station_file_name", str(file_name))
+    Station.get_stations.cache_clear()
+    try:
+        first, second = Station.get_stations().values()
+        assert first._in_table
+        position = first.position
+        assert (position.x, position.y) == (first.longitude, first.latitude)
+        assert second._position is not None
+    finally:
+        # don't leave the temporary table behind for the other tests
+        Station.get_stations.cache_clear()
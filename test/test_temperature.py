@@ -1,5 +1,6 @@
 """Test temperature."""
 
+import numpy as np
 import pytest
 from metar.Datatypes import temperature, UnitsError
 
@@ -61,3 +62,17 @@ def test_conversions():
     assert temperature("10", "C").string("C") == "10.0 C"
     assert temperature("10", "C").string("F") == "50.0 F"
     assert temperature("10", "C").string("K") == "283.1 K"
+
+
+def test_string_rounding():
+    """Test rounding of converted temperatures in strings."""
+    # the value is rounded as stored, without pint's conversion noise
+    assert temperature("32", "F").string("K") == "273.1 K"
+    # a negative zero is printed without its sign
+    assert temperature("M0", "C").string() == "0.0 °C"
+    assert temperature("M0.04", "C").string() == "0.0 °C"
+
+
+def test_array_input():
+    """Test that non-string, unhashable numbers are accepted."""
+    assert temperature(np.array(5.0)).value() == 5.0
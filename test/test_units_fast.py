@@ -0,0 +1,33 @@
+"""Test metar/_units_fast.py."""
+import numpy as np
+from metar._units_fast import CONV, apply_conversion, convert
+
+
+def test_round_trip():
+    """Converting to any unit and back gives the original value."""
+    for kind, conversions in CONV.items():
+        for src, dst in conversions:
+            there = convert(kind, 12.5, src, dst)
+            assert abs(convert(kind, there, dst, src) - 12.5) < 1e-9
+
+
+def test_conversions():
+    """Spot-check the conversion factors."""
+    assert convert("temperature", 32.0, "F", "C") == 0.0
+    assert abs(convert("temperature", 0.0, "C", "K") - 273.15) < 1e-9
+    assert abs(convert("pressure", 30.0, "IN", "MB") - 1015.917) < 0.001
+    assert convert("pressure", 1000.0, "HPA", "MB") == 1000.0
+    assert abs(convert("speed", 10.0, "KT", "MPS") - 5.1444) < 0.0001
+    assert abs(convert("distance", 1.0, "SM", "FT") - 5280.0) < 1e-9
+    assert abs(convert("precipitation", 1.0, "IN", "CM") - 2.54) < 1e-9
+
+
+def test_apply_conversion():
+    """Arrays are converted element by element, like single values."""
+    conversion = CONV["temperature"][("F", "C")]
+    assert apply_conversion(conversion, 50.0) == 10.0
+    values = np.array([32.0, 50.0, 212.0])
+    converted = apply_conversion(conversion, values)
+    assert isinstance(converted, np.ndarray)
+    assert converted.tolist() == [convert("temperature", v, "F", "C") for v in values]
+    assert converted.tolist() == [0.0, 10.0, 100.0]